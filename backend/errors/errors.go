@@ -27,6 +27,7 @@ const (
 	ErrCodeNotFound      ErrorCode = "not_found"
 	ErrCodeConflict      ErrorCode = "conflict"
 	ErrCodeLimitExceeded ErrorCode = "limit_exceeded"
+	ErrCodeTooLarge      ErrorCode = "payload_too_large"
 
 	// System errors
 	ErrCodeInternal ErrorCode = "internal_error"
@@ -157,6 +158,8 @@ func HTTPStatusFromErrorCode(code ErrorCode) int {
 		return 404
 	case ErrCodeConflict:
 		return 409
+	case ErrCodeTooLarge:
+		return 413
 	case ErrCodeBusiness, ErrCodeInsufficientStock, ErrCodeLimitExceeded:
 		return 422
 	case ErrCodeTokenExpired:
@@ -10,10 +10,9 @@ import (
 	"strings"
 	"time"
 
-	"bantuaku/backend/services/kolosal"
-
 	"github.com/bantuaku/backend/middleware"
 	"github.com/bantuaku/backend/models"
+	"github.com/bantuaku/backend/services/kolosal"
 )
 
 // AIAnalyze handles AI analysis questions
@@ -39,9 +38,9 @@ func (h *Handler) AIAnalyze(w http.ResponseWriter, r *http.Request) {
 	cacheKey := fmt.Sprintf("ai:%s:%s", storeID, hashQuestion(req.Question))
 	cached, err := h.redis.Get(r.Context(), cacheKey)
 	if err == nil && cached != "" {
-		var response models.AIAnalyzeResponse
-		if json.Unmarshal([]byte(cached), &response) == nil {
-			respondJSON(w, http.StatusOK, response)
+		// Serve the cached encoding as-is instead of decoding and re-encoding it
+		if json.Valid([]byte(cached)) {
+			respondJSONBytes(w, http.StatusOK, []byte(cached))
 			return
 		}
 	}
@@ -59,10 +58,11 @@ func (h *Handler) AIAnalyze(w http.ResponseWriter, r *http.Request) {
 	var confidence float64
 	dataSources := []string{}
 
-	if h.config.KolosalAPIKey != "" {
-		client := kolosal.NewClient(h.config.KolosalAPIKey)
+	if h.kolosal != nil {
+		kolosalCtx, cancel := context.WithTimeout(ctx, kolosalCallTimeout)
+		defer cancel()
 
-		resp, err := client.CreateChatCompletion(ctx, kolosal.ChatCompletionRequest{
+		resp, err := h.kolosal.CreateChatCompletion(kolosalCtx, kolosal.ChatCompletionRequest{
 			Model: "default", // Use default model from Kolosal.ai
 			Messages: []kolosal.ChatCompletionMessage{
 				{Role: "system", Content: systemPrompt},
@@ -92,10 +92,14 @@ func (h *Handler) AIAnalyze(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Cache for 24 hours
-	cacheData, _ := json.Marshal(response)
+	cacheData, err := json.Marshal(response)
+	if err != nil {
+		respondError(w, http.StatusInternalServerError, "Failed to encode response")
+		return
+	}
 	h.redis.Set(ctx, cacheKey, string(cacheData), 24*time.Hour)
 
-	respondJSON(w, http.StatusOK, response)
+	respondJSONBytes(w, http.StatusOK, cacheData)
 }
 
 // StoreContext holds contextual data for AI
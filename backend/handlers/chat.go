@@ -1,6 +1,7 @@
 package handlers
 
 import (
+	"context"
 	"net/http"
 	"time"
 
@@ -111,15 +112,15 @@ func (h *Handler) SendMessage(w http.ResponseWriter, r *http.Request) {
 	var assistantReply string
 	var structuredPayload map[string]interface{}
 
-	if h.config.KolosalAPIKey != "" {
+	if h.kolosal != nil {
 		// Use Kolosal.ai for chat completion
-		client := kolosal.NewClient(h.config.KolosalAPIKey)
-		ctx := r.Context()
+		ctx, cancel := context.WithTimeout(r.Context(), kolosalCallTimeout)
+		defer cancel()
 
 		systemPrompt := "Kamu adalah Asisten Bantuaku, AI assistant untuk membantu UMKM Indonesia. Jawab dalam Bahasa Indonesia yang natural dan ramah."
 		userPrompt := req.Message
 
-		resp, err := client.CreateChatCompletion(ctx, kolosal.ChatCompletionRequest{
+		resp, err := h.kolosal.CreateChatCompletion(ctx, kolosal.ChatCompletionRequest{
 			Model: "default",
 			Messages: []kolosal.ChatCompletionMessage{
 				{Role: "system", Content: systemPrompt},
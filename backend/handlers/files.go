@@ -1,6 +1,8 @@
 package handlers
 
 import (
+	"bytes"
+	"context"
 	"encoding/base64"
 	"fmt"
 	"io"
@@ -21,6 +23,14 @@ const (
 	uploadDir   = "./uploads"
 )
 
+// sourceTypes maps supported upload extensions to their source type
+var sourceTypes = map[string]string{
+	".csv":  "csv",
+	".xlsx": "xlsx",
+	".xls":  "xlsx",
+	".pdf":  "pdf",
+}
+
 // UploadFileResponse represents the response when uploading a file
 type UploadFileResponse struct {
 	FileUploadID     string                `json:"file_upload_id"`
@@ -58,15 +68,8 @@ func (h *Handler) UploadFile(w http.ResponseWriter, r *http.Request) {
 
 	// Determine source type from file extension
 	ext := filepath.Ext(header.Filename)
-	sourceType := ""
-	switch ext {
-	case ".csv":
-		sourceType = "csv"
-	case ".xlsx", ".xls":
-		sourceType = "xlsx"
-	case ".pdf":
-		sourceType = "pdf"
-	default:
+	sourceType, ok := sourceTypes[ext]
+	if !ok {
 		h.respondError(w, fmt.Errorf("unsupported file type: %s", ext), r)
 		return
 	}
@@ -92,7 +95,17 @@ func (h *Handler) UploadFile(w http.ResponseWriter, r *http.Request) {
 	}
 	defer dst.Close()
 
-	if _, err := io.Copy(dst, file); err != nil {
+	// PDFs sent to OCR are captured while saving so they aren't read
+	// back from disk afterwards
+	runOCR := sourceType == "pdf" && h.kolosal != nil
+	var src io.Reader = file
+	var pdfData bytes.Buffer
+	if runOCR {
+		pdfData.Grow(int(header.Size))
+		src = io.TeeReader(file, &pdfData)
+	}
+
+	if _, err := io.Copy(dst, src); err != nil {
 		logger.Error("Failed to copy file", "error", err.Error())
 		h.respondError(w, fmt.Errorf("failed to save file"), r)
 		return
@@ -109,34 +122,27 @@ func (h *Handler) UploadFile(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Process file based on type
-	if sourceType == "pdf" && h.config.KolosalAPIKey != "" {
+	if runOCR {
 		// Use Kolosal.ai OCR for PDF processing
-		ctx := r.Context()
-		client := kolosal.NewClient(h.config.KolosalAPIKey)
+		ctx, cancel := context.WithTimeout(r.Context(), kolosalCallTimeout)
+		defer cancel()
+
+		// Encode captured file contents to base64
+		imageBase64 := base64.StdEncoding.EncodeToString(pdfData.Bytes())
+
+		_, err := h.kolosal.OCR(ctx, kolosal.OCRRequest{
+			Image:    imageBase64,
+			Language: "id", // Indonesian
+		})
 
-		// Read file from disk and encode to base64
-		savedFile, err := os.Open(storagePath)
 		if err == nil {
-			defer savedFile.Close()
-			fileBytes, err := io.ReadAll(savedFile)
-			if err == nil {
-				imageBase64 := base64.StdEncoding.EncodeToString(fileBytes)
-
-				_, err := client.OCR(ctx, kolosal.OCRRequest{
-					Image:    imageBase64,
-					Language: "id", // Indonesian
-				})
-
-				if err == nil {
-					response.Status = "processed"
-					// TODO: Parse OCR text to extract structured data (products, sales)
-					// For now, just mark as processed
-					logger.Info("PDF processed with OCR", "file_id", fileUploadID)
-				} else {
-					response.Status = "failed"
-					logger.Error("OCR processing failed", "error", err.Error())
-				}
-			}
+			response.Status = "processed"
+			// TODO: Parse OCR text to extract structured data (products, sales)
+			// For now, just mark as processed
+			logger.Info("PDF processed with OCR", "file_id", fileUploadID)
+		} else {
+			response.Status = "failed"
+			logger.Error("OCR processing failed", "error", err.Error())
 		}
 	} else if sourceType == "csv" || sourceType == "xlsx" {
 		// TODO: Implement CSV/XLSX parsing
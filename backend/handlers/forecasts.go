@@ -9,6 +9,7 @@ import (
 
 	"github.com/bantuaku/backend/middleware"
 	"github.com/bantuaku/backend/models"
+	"github.com/bantuaku/backend/services/forecasting"
 	"github.com/google/uuid"
 )
 
@@ -39,9 +40,9 @@ func (h *Handler) GetForecast(w http.ResponseWriter, r *http.Request) {
 	cacheKey := fmt.Sprintf("forecast:%s", productID)
 	cached, err := h.redis.Get(r.Context(), cacheKey)
 	if err == nil && cached != "" {
-		var forecast ForecastResponse
-		if json.Unmarshal([]byte(cached), &forecast) == nil {
-			respondJSON(w, http.StatusOK, forecast)
+		// Serve the cached encoding as-is instead of decoding and re-encoding it
+		if json.Valid([]byte(cached)) {
+			respondJSONBytes(w, http.StatusOK, []byte(cached))
 			return
 		}
 	}
@@ -57,21 +58,23 @@ func (h *Handler) GetForecast(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Get historical sales (last 90 days)
+	now := time.Now()
 	rows, err := h.db.Pool().Query(r.Context(), `
 		SELECT sale_date, SUM(quantity) as total_qty
 		FROM sales_history
 		WHERE product_id = $1 AND store_id = $2 AND sale_date >= $3
 		GROUP BY sale_date
 		ORDER BY sale_date ASC
-	`, productID, storeID, time.Now().AddDate(0, 0, -90))
+	`, productID, storeID, now.AddDate(0, 0, -90))
 	if err != nil {
 		respondError(w, http.StatusInternalServerError, "Failed to fetch sales history")
 		return
 	}
 	defer rows.Close()
 
-	var salesData []float64
-	var historicalSales []DailySales
+	// At most one row per day of the 90-day window
+	salesData := make([]float64, 0, 90)
+	historicalSales := make([]DailySales, 0, 90)
 	for rows.Next() {
 		var date time.Time
 		var qty int
@@ -89,15 +92,18 @@ func (h *Handler) GetForecast(w http.ResponseWriter, r *http.Request) {
 	var confidence float64
 	algorithm := "ensemble"
 
+	// Mean and spread are shared by the trend, confidence and simple-average paths
+	avg, stdDev := forecasting.MeanStdDev(salesData)
+
 	if len(salesData) >= 7 {
 		// Simple Moving Average (7-day)
-		sma := simpleMovingAverage(salesData, 7)
+		sma := forecasting.SimpleMovingAverage(salesData, 7)
 
 		// Exponential Smoothing
-		es := exponentialSmoothing(salesData, 0.3)
+		es := forecasting.ExponentialSmoothing(salesData, 0.3)
 
 		// Trend extraction
-		trend := trendExtraction(salesData)
+		trend := forecasting.TrendExtraction(salesData, avg)
 
 		// Ensemble prediction
 		predicted := sma*0.4 + es*0.35 + trend*0.25
@@ -106,26 +112,16 @@ func (h *Handler) GetForecast(w http.ResponseWriter, r *http.Request) {
 		forecast60d = int(math.Round(predicted * 60))
 		forecast90d = int(math.Round(predicted * 90))
 
-		confidence = calculateConfidence(salesData, predicted)
+		confidence = forecasting.CalculateConfidence(avg, stdDev, predicted)
 	} else if len(salesData) > 0 {
 		// Simple average for limited data
-		sum := 0.0
-		for _, v := range salesData {
-			sum += v
-		}
-		avg := sum / float64(len(salesData))
-
 		forecast30d = int(math.Round(avg * 30))
 		forecast60d = int(math.Round(avg * 60))
 		forecast90d = int(math.Round(avg * 90))
 		confidence = 0.5 // Lower confidence for limited data
 		algorithm = "simple_average"
 	} else {
-		// No data
-		forecast30d = 0
-		forecast60d = 0
-		forecast90d = 0
-		confidence = 0
+		// No data: forecasts and confidence keep their zero values
 		algorithm = "no_data"
 	}
 
@@ -138,18 +134,22 @@ func (h *Handler) GetForecast(w http.ResponseWriter, r *http.Request) {
 			Forecast90d: forecast90d,
 			Confidence:  confidence,
 			Algorithm:   algorithm,
-			GeneratedAt: time.Now(),
-			ExpiresAt:   time.Now().Add(time.Hour),
+			GeneratedAt: now,
+			ExpiresAt:   now.Add(time.Hour),
 		},
 		ProductName:     productName,
 		HistoricalSales: historicalSales,
 	}
 
 	// Cache the result
-	cacheData, _ := json.Marshal(forecastResp)
+	cacheData, err := json.Marshal(forecastResp)
+	if err != nil {
+		respondError(w, http.StatusInternalServerError, "Failed to encode response")
+		return
+	}
 	h.redis.Set(r.Context(), cacheKey, string(cacheData), time.Hour)
 
-	respondJSON(w, http.StatusOK, forecastResp)
+	respondJSONBytes(w, http.StatusOK, cacheData)
 }
 
 // GetRecommendations returns demand forecast recommendations for all products
@@ -160,6 +160,16 @@ func (h *Handler) GetRecommendations(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// Check cache first
+	cacheKey := recommendationsCacheKey(storeID)
+	cached, err := h.redis.Get(r.Context(), cacheKey)
+	if err == nil && cached != "" {
+		if json.Valid([]byte(cached)) {
+			respondJSONBytes(w, http.StatusOK, []byte(cached))
+			return
+		}
+	}
+
 	// Get all products with their sales data
 	rows, err := h.db.Pool().Query(r.Context(), `
 		SELECT p.id, p.product_name,
@@ -221,99 +231,18 @@ func (h *Handler) GetRecommendations(w http.ResponseWriter, r *http.Request) {
 		})
 	}
 
-	respondJSON(w, http.StatusOK, recommendations)
-}
-
-// Forecasting helper functions
-
-func simpleMovingAverage(data []float64, period int) float64 {
-	if len(data) < period {
-		period = len(data)
-	}
-	if period == 0 {
-		return 0
-	}
-
-	sum := 0.0
-	for i := len(data) - period; i < len(data); i++ {
-		sum += data[i]
-	}
-	return sum / float64(period)
-}
-
-func exponentialSmoothing(data []float64, alpha float64) float64 {
-	if len(data) == 0 {
-		return 0
-	}
-
-	result := data[0]
-	for i := 1; i < len(data); i++ {
-		result = alpha*data[i] + (1-alpha)*result
-	}
-	return result
-}
-
-func trendExtraction(data []float64) float64 {
-	n := float64(len(data))
-	if n == 0 {
-		return 0
-	}
-
-	// Calculate average
-	sum := 0.0
-	for _, v := range data {
-		sum += v
-	}
-	avg := sum / n
-
-	// Calculate trend
-	sumNumerator := 0.0
-	sumDenominator := 0.0
-
-	for i, v := range data {
-		x := float64(i) - (n-1)/2
-		sumNumerator += x * (v - avg)
-		sumDenominator += x * x
-	}
-
-	trend := 0.0
-	if sumDenominator != 0 {
-		trend = sumNumerator / sumDenominator
+	// Cache for 5 minutes; sales and product changes invalidate it sooner
+	cacheData, err := json.Marshal(recommendations)
+	if err != nil {
+		respondError(w, http.StatusInternalServerError, "Failed to encode response")
+		return
 	}
+	h.redis.Set(r.Context(), cacheKey, string(cacheData), 5*time.Minute)
 
-	// Project forward (average + trend for 7 days)
-	lastValue := data[len(data)-1]
-	return lastValue + trend*7
+	respondJSONBytes(w, http.StatusOK, cacheData)
 }
 
-func calculateConfidence(data []float64, forecast float64) float64 {
-	if len(data) == 0 || forecast == 0 {
-		return 0
-	}
-
-	// Calculate average
-	sum := 0.0
-	for _, v := range data {
-		sum += v
-	}
-	avg := sum / float64(len(data))
-
-	if avg == 0 {
-		return 0.5
-	}
-
-	// Calculate standard deviation
-	variance := 0.0
-	for _, v := range data {
-		variance += (v - avg) * (v - avg)
-	}
-	stdDev := math.Sqrt(variance / float64(len(data)))
-
-	// Coefficient of variation
-	cv := stdDev / avg
-
-	// Confidence: lower CV = higher confidence
-	confidence := math.Max(0, math.Min(1, 1-cv))
-
-	return confidence
+// recommendationsCacheKey returns the cache key for a store's recommendations
+func recommendationsCacheKey(storeID string) string {
+	return fmt.Sprintf("recommendations:%s", storeID)
 }
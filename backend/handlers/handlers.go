@@ -3,27 +3,41 @@ package handlers
 import (
 	"encoding/json"
 	"net/http"
+	"time"
 
 	"github.com/bantuaku/backend/config"
 	"github.com/bantuaku/backend/errors"
 	"github.com/bantuaku/backend/logger"
+	"github.com/bantuaku/backend/services/kolosal"
 	"github.com/bantuaku/backend/services/storage"
 )
 
+// kolosalCallTimeout bounds each Kolosal call a handler makes, retries
+// included, so the response is written before the server's 15s write timeout
+const kolosalCallTimeout = 12 * time.Second
+
 // Handler holds dependencies for HTTP handlers
 type Handler struct {
-	db     *storage.Postgres
-	redis  *storage.Redis
-	config *config.Config
+	db      *storage.Postgres
+	redis   *storage.Redis
+	config  *config.Config
+	kolosal *kolosal.Client // nil when no Kolosal API key is configured
 }
 
 // New creates a new Handler with dependencies
 func New(db *storage.Postgres, redis *storage.Redis, cfg *config.Config) *Handler {
-	return &Handler{
+	h := &Handler{
 		db:     db,
 		redis:  redis,
 		config: cfg,
 	}
+
+	// Share one client (and its connection pool) across requests
+	if cfg.KolosalAPIKey != "" {
+		h.kolosal = kolosal.NewClient(cfg.KolosalAPIKey)
+	}
+
+	return h
 }
 
 // HealthCheck returns the health status of the API
@@ -77,6 +91,13 @@ func respondJSON(w http.ResponseWriter, status int, data interface{}) {
 	}
 }
 
+// respondJSONBytes sends an already-encoded JSON response
+func respondJSONBytes(w http.ResponseWriter, status int, data []byte) {
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(status)
+	w.Write(data)
+}
+
 // Mock respondError 函数以保持向后兼容性
 func respondError(w http.ResponseWriter, status int, message string) {
 	errors.WriteJSONError(w, errors.NewAppError(errors.ErrCodeInternal, message, ""), errors.ErrCodeInternal)
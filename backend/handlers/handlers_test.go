@@ -1,8 +1,10 @@
 package handlers
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
+	"mime/multipart"
 	"net/http"
 	"net/http/httptest"
 	"strings"
@@ -10,6 +12,7 @@ import (
 	"time"
 
 	"github.com/bantuaku/backend/config"
+	"github.com/bantuaku/backend/middleware"
 	"github.com/bantuaku/backend/models"
 	"github.com/bantuaku/backend/services/storage"
 	"github.com/google/uuid"
@@ -17,7 +20,7 @@ import (
 
 // testDB is a test database wrapper
 type testDB struct {
-	*storage.PostgresDB
+	*storage.Postgres
 }
 
 // setupTestDB creates a test database connection
@@ -75,7 +78,7 @@ func setupTestHandler(t *testing.T) (*Handler, *testDB) {
 		CORSOrigin:    "http://localhost:3000",
 	}
 
-	handler := New(db, redis, cfg)
+	handler := New(db.Postgres, redis, cfg)
 
 	return handler, db
 }
@@ -386,3 +389,81 @@ func TestProductHandlers(t *testing.T) {
 		}
 	})
 }
+
+// TestImportCSVReadErrors tests that unreadable upload bodies end the import
+func TestImportCSVReadErrors(t *testing.T) {
+	handler, db := setupTestHandler(t)
+	defer cleanupTestDB(t, db)
+
+	uploadBody := func(fieldSize, rows int) (*bytes.Buffer, string) {
+		var body bytes.Buffer
+		mw := multipart.NewWriter(&body)
+		if fieldSize > 0 {
+			mw.WriteField("note", strings.Repeat("x", fieldSize))
+		}
+		fw, _ := mw.CreateFormFile("file", "sales.csv")
+		fw.Write([]byte("product_name,quantity,sale_date\n"))
+		for i := 0; i < rows; i++ {
+			fw.Write([]byte("Test Product,1,2024-01-01\n"))
+		}
+		mw.Close()
+		return &body, mw.FormDataContentType()
+	}
+
+	tests := []struct {
+		name           string
+		fieldSize      int
+		rows           int
+		truncate       bool
+		expectedStatus int
+	}{
+		{
+			name:           "Truncated body",
+			rows:           10,
+			truncate:       true,
+			expectedStatus: http.StatusBadRequest,
+		},
+		{
+			name:           "Oversized body",
+			rows:           maxCSVUploadSize / 20,
+			expectedStatus: http.StatusRequestEntityTooLarge,
+		},
+		{
+			name:           "Oversized field before file",
+			fieldSize:      maxCSVUploadSize + 1,
+			rows:           10,
+			expectedStatus: http.StatusRequestEntityTooLarge,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			body, contentType := uploadBody(tt.fieldSize, tt.rows)
+			if tt.truncate {
+				// Drop the closing boundary and part of the last row
+				body.Truncate(body.Len() / 2)
+			}
+
+			req := httptest.NewRequest(http.MethodPost, "/api/v1/sales/import", body)
+			req.Header.Set("Content-Type", contentType)
+			req = req.WithContext(context.WithValue(req.Context(), middleware.StoreIDKey, uuid.New().String()))
+
+			w := httptest.NewRecorder()
+			done := make(chan struct{})
+			go func() {
+				handler.ImportCSV(w, req)
+				close(done)
+			}()
+
+			select {
+			case <-done:
+			case <-time.After(5 * time.Second):
+				t.Fatal("ImportCSV did not return")
+			}
+
+			if w.Code != tt.expectedStatus {
+				t.Errorf("Expected status %d, got %d", tt.expectedStatus, w.Code)
+			}
+		})
+	}
+}
@@ -176,6 +176,15 @@ func (h *Handler) WooCommerceSyncNow(w http.ResponseWriter, r *http.Request) {
 	consumerKey := metadata["consumer_key"]
 	consumerSecret := metadata["consumer_secret"]
 
+	// Synced rows change the store's recommendations, even when a later
+	// step of the sync fails
+	var syncedProducts, syncedOrders int
+	defer func() {
+		if syncedProducts > 0 || syncedOrders > 0 {
+			h.redis.Delete(r.Context(), recommendationsCacheKey(storeID))
+		}
+	}()
+
 	client := &http.Client{Timeout: 30 * time.Second}
 	auth := base64.StdEncoding.EncodeToString([]byte(consumerKey + ":" + consumerSecret))
 
@@ -202,7 +211,6 @@ func (h *Handler) WooCommerceSyncNow(w http.ResponseWriter, r *http.Request) {
 	body, _ := io.ReadAll(productResp.Body)
 	json.Unmarshal(body, &wooProducts)
 
-	syncedProducts := 0
 	for _, wp := range wooProducts {
 		price := 0.0
 		fmt.Sscanf(wp.Price, "%f", &price)
@@ -248,7 +256,6 @@ func (h *Handler) WooCommerceSyncNow(w http.ResponseWriter, r *http.Request) {
 	orderBody, _ := io.ReadAll(orderResp.Body)
 	json.Unmarshal(orderBody, &wooOrders)
 
-	syncedOrders := 0
 	for _, wo := range wooOrders {
 		orderDate, _ := time.Parse(time.RFC3339, wo.DateCreated)
 
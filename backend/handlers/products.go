@@ -126,6 +126,8 @@ func (h *Handler) CreateProduct(w http.ResponseWriter, r *http.Request) {
 		UpdatedAt:   now,
 	}
 
+	h.redis.Delete(r.Context(), recommendationsCacheKey(storeID))
+
 	respondJSON(w, http.StatusCreated, product)
 }
 
@@ -192,6 +194,8 @@ func (h *Handler) UpdateProduct(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	h.redis.Delete(r.Context(), recommendationsCacheKey(storeID))
+
 	// Fetch and return updated product
 	var p models.Product
 	h.db.Pool().QueryRow(r.Context(), `
@@ -226,5 +230,7 @@ func (h *Handler) DeleteProduct(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	h.redis.Delete(r.Context(), recommendationsCacheKey(storeID))
+
 	respondJSON(w, http.StatusOK, map[string]string{"message": "Product deleted"})
 }
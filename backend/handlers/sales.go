@@ -2,16 +2,32 @@ package handlers
 
 import (
 	"encoding/csv"
+	"errors"
 	"fmt"
 	"io"
+	"mime/multipart"
 	"net/http"
+	"sort"
 	"strconv"
 	"time"
 
+	apperrors "github.com/bantuaku/backend/errors"
 	"github.com/bantuaku/backend/middleware"
 	"github.com/bantuaku/backend/models"
+	"github.com/jackc/pgx/v5"
 )
 
+const (
+	// maxCSVUploadSize caps the request body accepted by ImportCSV
+	maxCSVUploadSize = 10 << 20
+
+	// csvInsertBatchSize is how many CSV rows ImportCSV inserts per round trip
+	csvInsertBatchSize = 500
+)
+
+// saleDateFormats lists the accepted CSV sale_date layouts, tried in order
+var saleDateFormats = []string{"2006-01-02", "02/01/2006", "01/02/2006", "2006/01/02"}
+
 // RecordSaleRequest represents a manual sale entry
 type RecordSaleRequest struct {
 	ProductID string    `json:"product_id"`
@@ -32,6 +48,12 @@ type ImportError struct {
 	Error string `json:"error"`
 }
 
+// csvSale is a validated CSV row queued for insertion
+type csvSale struct {
+	row       int
+	productID string
+}
+
 // RecordSale records a single manual sale
 func (h *Handler) RecordSale(w http.ResponseWriter, r *http.Request) {
 	storeID := middleware.GetStoreID(r.Context())
@@ -86,9 +108,9 @@ func (h *Handler) RecordSale(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// Invalidate forecast cache for this product
+	// Invalidate the product's forecast and the store's recommendations
 	cacheKey := fmt.Sprintf("forecast:%s", req.ProductID)
-	h.redis.Delete(r.Context(), cacheKey)
+	h.redis.Delete(r.Context(), cacheKey, recommendationsCacheKey(storeID))
 
 	respondJSON(w, http.StatusCreated, models.Sale{
 		ID:        saleID,
@@ -110,16 +132,31 @@ func (h *Handler) ImportCSV(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// Parse multipart form (max 10MB)
-	if err := r.ParseMultipartForm(10 << 20); err != nil {
+	// Stream the multipart body (max 10MB) straight into the CSV parser
+	// instead of spooling the upload to memory or temp files first
+	r.Body = http.MaxBytesReader(w, r.Body, maxCSVUploadSize)
+	mr, err := r.MultipartReader()
+	if err != nil {
 		respondError(w, http.StatusBadRequest, "Failed to parse form data")
 		return
 	}
 
-	file, _, err := r.FormFile("file")
-	if err != nil {
-		respondError(w, http.StatusBadRequest, "File is required")
-		return
+	var file *multipart.Part
+	for {
+		part, err := mr.NextPart()
+		if err == io.EOF {
+			respondError(w, http.StatusBadRequest, "File is required")
+			return
+		}
+		if err != nil {
+			respondCSVReadError(w, err, "Failed to read form data")
+			return
+		}
+		if part.FormName() == "file" {
+			file = part
+			break
+		}
+		part.Close()
 	}
 	defer file.Close()
 
@@ -129,7 +166,7 @@ func (h *Handler) ImportCSV(w http.ResponseWriter, r *http.Request) {
 	// Read header
 	header, err := reader.Read()
 	if err != nil {
-		respondError(w, http.StatusBadRequest, "Failed to read CSV header")
+		respondCSVReadError(w, err, "Failed to read CSV header")
 		return
 	}
 
@@ -164,6 +201,58 @@ func (h *Handler) ImportCSV(w http.ResponseWriter, r *http.Request) {
 	}
 
 	result := ImportResult{}
+
+	// Imported sales change the store's forecasts and recommendations, even
+	// when the upload fails partway through
+	importedProducts := make(map[string]bool)
+	defer func() {
+		if len(importedProducts) == 0 {
+			return
+		}
+		cacheKeys := make([]string, 0, len(importedProducts)+1)
+		for productID := range importedProducts {
+			cacheKeys = append(cacheKeys, fmt.Sprintf("forecast:%s", productID))
+		}
+		cacheKeys = append(cacheKeys, recommendationsCacheKey(storeID))
+		h.redis.Delete(r.Context(), cacheKeys...)
+	}()
+
+	// Insert rows in batches while reading, so memory stays bounded by the
+	// batch and slow inserts don't hold the body open past the server's read
+	// timeout
+	batch := &pgx.Batch{}
+	pending := make([]csvSale, 0, csvInsertBatchSize)
+	flush := func() {
+		if len(pending) == 0 {
+			return
+		}
+
+		// A batch runs as one implicit transaction, so a failed insert
+		// rolls back every row in it
+		br := h.db.Pool().SendBatch(r.Context(), batch)
+		var batchErr error
+		for range pending {
+			if _, err := br.Exec(); err != nil && batchErr == nil {
+				batchErr = err
+			}
+		}
+		if err := br.Close(); err != nil && batchErr == nil {
+			batchErr = err
+		}
+
+		for _, sale := range pending {
+			if batchErr != nil {
+				result.Errors = append(result.Errors, ImportError{Row: sale.row, Error: "Database error"})
+				continue
+			}
+			result.SuccessCount++
+			importedProducts[sale.productID] = true
+		}
+
+		batch = &pgx.Batch{}
+		pending = pending[:0]
+	}
+
 	rowNum := 1 // Header is row 0
 
 	for {
@@ -174,6 +263,13 @@ func (h *Handler) ImportCSV(w http.ResponseWriter, r *http.Request) {
 		rowNum++
 
 		if err != nil {
+			// A parse error only spoils its own row; any other error comes
+			// from the body itself and would repeat on every later Read
+			var parseErr *csv.ParseError
+			if !errors.As(err, &parseErr) {
+				respondCSVReadError(w, err, fmt.Sprintf("Failed to read CSV file after importing %d rows", result.SuccessCount))
+				return
+			}
 			result.Errors = append(result.Errors, ImportError{Row: rowNum, Error: "Failed to parse row"})
 			continue
 		}
@@ -207,8 +303,7 @@ func (h *Handler) ImportCSV(w http.ResponseWriter, r *http.Request) {
 
 		// Parse date (try multiple formats)
 		var saleDate time.Time
-		dateFormats := []string{"2006-01-02", "02/01/2006", "01/02/2006", "2006/01/02"}
-		for _, format := range dateFormats {
+		for _, format := range saleDateFormats {
 			if parsed, err := time.Parse(format, saleDateStr); err == nil {
 				saleDate = parsed
 				break
@@ -219,27 +314,38 @@ func (h *Handler) ImportCSV(w http.ResponseWriter, r *http.Request) {
 			continue
 		}
 
-		// Insert sale
-		_, err = h.db.Pool().Exec(r.Context(), `
+		// Queue sale
+		batch.Queue(`
 			INSERT INTO sales_history (store_id, product_id, quantity, price, sale_date, source, created_at)
 			VALUES ($1, $2, $3, $4, $5, 'csv', $6)
 		`, storeID, productID, quantity, price, saleDate, time.Now())
+		pending = append(pending, csvSale{row: rowNum, productID: productID})
 
-		if err != nil {
-			result.Errors = append(result.Errors, ImportError{Row: rowNum, Error: "Database error"})
-			continue
+		if len(pending) == csvInsertBatchSize {
+			flush()
 		}
-
-		result.SuccessCount++
-
-		// Invalidate forecast cache for this product
-		cacheKey := fmt.Sprintf("forecast:%s", productID)
-		h.redis.Delete(r.Context(), cacheKey)
 	}
+	flush()
+
+	// Database errors are reported per batch, after later rows were checked
+	sort.SliceStable(result.Errors, func(i, j int) bool {
+		return result.Errors[i].Row < result.Errors[j].Row
+	})
 
 	respondJSON(w, http.StatusOK, result)
 }
 
+// respondCSVReadError reports a CSV upload that could not be read to the end
+func respondCSVReadError(w http.ResponseWriter, err error, message string) {
+	var maxErr *http.MaxBytesError
+	if errors.As(err, &maxErr) {
+		tooLarge := apperrors.NewAppError(apperrors.ErrCodeTooLarge, "CSV file exceeds the 10MB limit", "")
+		apperrors.WriteJSONError(w, tooLarge, apperrors.ErrCodeTooLarge)
+		return
+	}
+	apperrors.WriteJSONError(w, apperrors.NewValidationError(message, err.Error()), apperrors.ErrCodeValidation)
+}
+
 // ListSales returns sales history for the store
 func (h *Handler) ListSales(w http.ResponseWriter, r *http.Request) {
 	storeID := middleware.GetStoreID(r.Context())
@@ -281,7 +387,7 @@ func (h *Handler) ListSales(w http.ResponseWriter, r *http.Request) {
 	}
 	defer rows.Close()
 
-	sales := []models.Sale{}
+	sales := make([]models.Sale, 0, limit)
 	for rows.Next() {
 		var s models.Sale
 		err := rows.Scan(&s.ID, &s.StoreID, &s.ProductID, &s.Quantity, &s.Price, &s.SaleDate, &s.Source, &s.CreatedAt)
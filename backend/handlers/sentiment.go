@@ -24,9 +24,9 @@ func (h *Handler) GetSentiment(w http.ResponseWriter, r *http.Request) {
 	cacheKey := fmt.Sprintf("sentiment:%s", productID)
 	cached, err := h.redis.Get(r.Context(), cacheKey)
 	if err == nil && cached != "" {
-		var sentiment models.SentimentData
-		if json.Unmarshal([]byte(cached), &sentiment) == nil {
-			respondJSON(w, http.StatusOK, sentiment)
+		// Serve the cached encoding as-is instead of decoding and re-encoding it
+		if json.Valid([]byte(cached)) {
+			respondJSONBytes(w, http.StatusOK, []byte(cached))
 			return
 		}
 	}
@@ -46,10 +46,14 @@ func (h *Handler) GetSentiment(w http.ResponseWriter, r *http.Request) {
 	sentiment := generateSampleSentiment(productID, productName)
 
 	// Cache for 6 hours
-	cacheData, _ := json.Marshal(sentiment)
+	cacheData, err := json.Marshal(sentiment)
+	if err != nil {
+		respondError(w, http.StatusInternalServerError, "Failed to encode response")
+		return
+	}
 	h.redis.Set(r.Context(), cacheKey, string(cacheData), 6*time.Hour)
 
-	respondJSON(w, http.StatusOK, sentiment)
+	respondJSONBytes(w, http.StatusOK, cacheData)
 }
 
 // GetMarketTrends returns market trend data
@@ -64,9 +68,9 @@ func (h *Handler) GetMarketTrends(w http.ResponseWriter, r *http.Request) {
 	cacheKey := fmt.Sprintf("trends:%s", storeID)
 	cached, err := h.redis.Get(r.Context(), cacheKey)
 	if err == nil && cached != "" {
-		var trends []models.MarketTrend
-		if json.Unmarshal([]byte(cached), &trends) == nil {
-			respondJSON(w, http.StatusOK, trends)
+		// Serve the cached encoding as-is instead of decoding and re-encoding it
+		if json.Valid([]byte(cached)) {
+			respondJSONBytes(w, http.StatusOK, []byte(cached))
 			return
 		}
 	}
@@ -91,10 +95,14 @@ func (h *Handler) GetMarketTrends(w http.ResponseWriter, r *http.Request) {
 	trends := generateSampleTrends(categories)
 
 	// Cache for 24 hours
-	cacheData, _ := json.Marshal(trends)
+	cacheData, err := json.Marshal(trends)
+	if err != nil {
+		respondError(w, http.StatusInternalServerError, "Failed to encode response")
+		return
+	}
 	h.redis.Set(r.Context(), cacheKey, string(cacheData), 24*time.Hour)
 
-	respondJSON(w, http.StatusOK, trends)
+	respondJSONBytes(w, http.StatusOK, cacheData)
 }
 
 // Sample data generators for MVP demo
@@ -113,36 +121,37 @@ func generateSampleSentiment(productID, productName string) models.SentimentData
 	negativeCount := 2 + (hashVal % 5)
 	neutralCount := 5 + (hashVal % 10)
 
+	now := time.Now()
 	mentions := []models.Mention{
 		{
 			Source:    "instagram",
 			Text:      fmt.Sprintf("Produk %s bagus banget! Worth it 🔥", productName),
 			Sentiment: 0.8,
-			Date:      time.Now().AddDate(0, 0, -1),
+			Date:      now.AddDate(0, 0, -1),
 		},
 		{
 			Source:    "tiktok",
 			Text:      fmt.Sprintf("Review jujur %s - recommended buat yang cari kualitas!", productName),
 			Sentiment: 0.7,
-			Date:      time.Now().AddDate(0, 0, -2),
+			Date:      now.AddDate(0, 0, -2),
 		},
 		{
 			Source:    "review",
 			Text:      "Pengiriman cepat, barang sesuai deskripsi. Mantap!",
 			Sentiment: 0.9,
-			Date:      time.Now().AddDate(0, 0, -3),
+			Date:      now.AddDate(0, 0, -3),
 		},
 		{
 			Source:    "instagram",
 			Text:      "Lumayan sih, tapi harga agak mahal ya",
 			Sentiment: 0.3,
-			Date:      time.Now().AddDate(0, 0, -4),
+			Date:      now.AddDate(0, 0, -4),
 		},
 		{
 			Source:    "tiktok",
 			Text:      fmt.Sprintf("Unboxing %s! Packaging rapi dan aman 📦", productName),
 			Sentiment: 0.75,
-			Date:      time.Now().AddDate(0, 0, -5),
+			Date:      now.AddDate(0, 0, -5),
 		},
 	}
 
@@ -156,55 +165,65 @@ func generateSampleSentiment(productID, productName string) models.SentimentData
 	}
 }
 
+// baseMarketTrends are the sample trends shared by every store. Copies share
+// the GrowthRate pointers, so callers must treat them as read-only.
+var baseMarketTrends = []models.MarketTrend{
+	{
+		TrendName:  "Produk Ramah Lingkungan",
+		Category:   "eco-friendly",
+		TrendScore: 0.85,
+		GrowthRate: float64Ptr(25.5),
+		Source:     "google_trends",
+	},
+	{
+		TrendName:  "Fashion Lokal Indonesia",
+		Category:   "fashion",
+		TrendScore: 0.78,
+		GrowthRate: float64Ptr(18.3),
+		Source:     "social_media",
+	},
+	{
+		TrendName:  "Makanan Sehat",
+		Category:   "food",
+		TrendScore: 0.72,
+		GrowthRate: float64Ptr(15.2),
+		Source:     "marketplace",
+	},
+	{
+		TrendName:  "Skincare Natural",
+		Category:   "beauty",
+		TrendScore: 0.88,
+		GrowthRate: float64Ptr(32.1),
+		Source:     "instagram",
+	},
+	{
+		TrendName:  "Gadget Accessories",
+		Category:   "electronics",
+		TrendScore: 0.65,
+		GrowthRate: float64Ptr(12.4),
+		Source:     "marketplace",
+	},
+}
+
 func generateSampleTrends(categories []string) []models.MarketTrend {
-	trends := []models.MarketTrend{
-		{
-			Name:       "Produk Ramah Lingkungan",
-			Category:   "eco-friendly",
-			TrendScore: 0.85,
-			GrowthRate: 25.5,
-			Source:     "google_trends",
-		},
-		{
-			Name:       "Fashion Lokal Indonesia",
-			Category:   "fashion",
-			TrendScore: 0.78,
-			GrowthRate: 18.3,
-			Source:     "social_media",
-		},
-		{
-			Name:       "Makanan Sehat",
-			Category:   "food",
-			TrendScore: 0.72,
-			GrowthRate: 15.2,
-			Source:     "marketplace",
-		},
-		{
-			Name:       "Skincare Natural",
-			Category:   "beauty",
-			TrendScore: 0.88,
-			GrowthRate: 32.1,
-			Source:     "instagram",
-		},
-		{
-			Name:       "Gadget Accessories",
-			Category:   "electronics",
-			TrendScore: 0.65,
-			GrowthRate: 12.4,
-			Source:     "marketplace",
-		},
-	}
+	trends := make([]models.MarketTrend, len(baseMarketTrends), len(baseMarketTrends)+len(categories))
+	copy(trends, baseMarketTrends)
 
 	// Add category-specific trends
 	for _, cat := range categories {
 		trends = append(trends, models.MarketTrend{
-			Name:       fmt.Sprintf("Trend %s", cat),
+			TrendName:  fmt.Sprintf("Trend %s", cat),
 			Category:   cat,
 			TrendScore: 0.6 + (float64(len(cat)%30) / 100.0),
-			GrowthRate: 10.0 + float64(len(cat)%20),
+			GrowthRate: float64Ptr(10.0 + float64(len(cat)%20)),
 			Source:     "analysis",
 		})
 	}
 
 	return trends
 }
+
+// float64Ptr returns a pointer to v
+func float64Ptr(v float64) *float64 {
+	return &v
+}
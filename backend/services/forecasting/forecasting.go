@@ -0,0 +1,95 @@
+package forecasting
+
+import "math"
+
+// MeanStdDev returns the mean and population standard deviation of data in
+// a single pass (Welford's algorithm)
+func MeanStdDev(data []float64) (float64, float64) {
+	if len(data) == 0 {
+		return 0, 0
+	}
+
+	avg, m2 := 0.0, 0.0
+	for i, v := range data {
+		delta := v - avg
+		avg += delta / float64(i+1)
+		m2 += delta * (v - avg)
+	}
+	return avg, math.Sqrt(m2 / float64(len(data)))
+}
+
+// SimpleMovingAverage returns the mean of the last period values of data
+func SimpleMovingAverage(data []float64, period int) float64 {
+	if len(data) < period {
+		period = len(data)
+	}
+	if period == 0 {
+		return 0
+	}
+
+	sum := 0.0
+	for i := len(data) - period; i < len(data); i++ {
+		sum += data[i]
+	}
+	return sum / float64(period)
+}
+
+// ExponentialSmoothing returns the exponentially smoothed level of data
+func ExponentialSmoothing(data []float64, alpha float64) float64 {
+	if len(data) == 0 {
+		return 0
+	}
+
+	result := data[0]
+	for i := 1; i < len(data); i++ {
+		result = alpha*data[i] + (1-alpha)*result
+	}
+	return result
+}
+
+// TrendExtraction projects data 7 days ahead along its least-squares trend
+func TrendExtraction(data []float64, avg float64) float64 {
+	n := float64(len(data))
+	if n == 0 {
+		return 0
+	}
+
+	// Calculate trend. The x values are the indexes 0..n-1 centered on
+	// their mean, so the sum of x² has the closed form n(n²-1)/12.
+	sumNumerator := 0.0
+	sumDenominator := n * (n*n - 1) / 12
+
+	for i, v := range data {
+		x := float64(i) - (n-1)/2
+		sumNumerator += x * (v - avg)
+	}
+
+	trend := 0.0
+	if sumDenominator != 0 {
+		trend = sumNumerator / sumDenominator
+	}
+
+	// Project forward (average + trend for 7 days)
+	lastValue := data[len(data)-1]
+	return lastValue + trend*7
+}
+
+// CalculateConfidence scores a forecast from the coefficient of variation
+// of the history it was built from
+func CalculateConfidence(avg, stdDev, forecast float64) float64 {
+	if forecast == 0 {
+		return 0
+	}
+
+	if avg == 0 {
+		return 0.5
+	}
+
+	// Coefficient of variation
+	cv := stdDev / avg
+
+	// Confidence: lower CV = higher confidence
+	confidence := math.Max(0, math.Min(1, 1-cv))
+
+	return confidence
+}
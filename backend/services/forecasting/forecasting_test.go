@@ -0,0 +1,59 @@
+package forecasting
+
+import (
+	"math"
+	"testing"
+)
+
+// TestForecastHelpers tests the forecasting helpers against naive implementations
+func TestForecastHelpers(t *testing.T) {
+	tests := []struct {
+		name string
+		data []float64
+	}{
+		{name: "Single value", data: []float64{5}},
+		{name: "Flat", data: []float64{3, 3, 3, 3, 3, 3, 3}},
+		{name: "Increasing", data: []float64{1, 2, 3, 4, 5, 6, 7, 8}},
+		{name: "Noisy", data: []float64{12, 7, 0, 15, 9, 3, 22, 11, 6, 14}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			n := float64(len(tt.data))
+
+			sum := 0.0
+			for _, v := range tt.data {
+				sum += v
+			}
+			wantMean := sum / n
+
+			variance := 0.0
+			numerator, denominator := 0.0, 0.0
+			for i, v := range tt.data {
+				variance += (v - wantMean) * (v - wantMean)
+				x := float64(i) - (n-1)/2
+				numerator += x * (v - wantMean)
+				denominator += x * x
+			}
+			wantStdDev := math.Sqrt(variance / n)
+
+			slope := 0.0
+			if denominator != 0 {
+				slope = numerator / denominator
+			}
+			wantTrend := tt.data[len(tt.data)-1] + slope*7
+
+			avg, stdDev := MeanStdDev(tt.data)
+			if math.Abs(avg-wantMean) > 1e-9 {
+				t.Errorf("Expected mean %f, got %f", wantMean, avg)
+			}
+			if math.Abs(stdDev-wantStdDev) > 1e-9 {
+				t.Errorf("Expected standard deviation %f, got %f", wantStdDev, stdDev)
+			}
+
+			if trend := TrendExtraction(tt.data, avg); math.Abs(trend-wantTrend) > 1e-9 {
+				t.Errorf("Expected trend %f, got %f", wantTrend, trend)
+			}
+		})
+	}
+}
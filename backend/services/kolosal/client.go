@@ -4,8 +4,11 @@ import (
 	"bytes"
 	"context"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
+	"math/rand"
+	"net"
 	"net/http"
 	"time"
 )
@@ -13,13 +16,37 @@ import (
 const (
 	KolosalAPIBaseURL = "https://api.kolosal.ai"
 	DefaultTimeout    = 30 * time.Second
+
+	// Keep-alive connections kept per API host; the default of 2 is too
+	// low for a client shared by concurrent handlers
+	DefaultMaxIdleConnsPerHost = 16
+
+	// Retry policy for transient API failures. Callers bound the whole
+	// call, first attempt included, through the ctx deadline.
+	DefaultMaxRetries     = 3
+	DefaultRetryBaseDelay = 500 * time.Millisecond
+	DefaultRetryTimeout   = 10 * time.Second
+	retryMaxDelay         = 5 * time.Second
+	retryJitter           = 0.5
 )
 
+// retryableStatus lists HTTP status codes worth retrying
+var retryableStatus = map[int]bool{
+	http.StatusTooManyRequests:     true,
+	http.StatusInternalServerError: true,
+	http.StatusBadGateway:          true,
+	http.StatusServiceUnavailable:  true,
+	529:                            true, // Provider overloaded
+}
+
 // Client represents a Kolosal.ai API client
 type Client struct {
-	APIKey     string
-	HTTPClient *http.Client
-	BaseURL    string
+	APIKey         string
+	HTTPClient     *http.Client
+	BaseURL        string
+	MaxRetries     int           // Total attempts per call, including the first
+	RetryBaseDelay time.Duration // Backoff before the first retry, doubled after each
+	RetryTimeout   time.Duration // Upper bound on backoff and retries after the first attempt
 }
 
 // NewClient creates a new Kolosal.ai API client
@@ -27,10 +54,101 @@ func NewClient(apiKey string) *Client {
 	return &Client{
 		APIKey: apiKey,
 		HTTPClient: &http.Client{
-			Timeout: DefaultTimeout,
+			Timeout:   DefaultTimeout,
+			Transport: newTransport(),
 		},
-		BaseURL: KolosalAPIBaseURL,
+		BaseURL:        KolosalAPIBaseURL,
+		MaxRetries:     DefaultMaxRetries,
+		RetryBaseDelay: DefaultRetryBaseDelay,
+		RetryTimeout:   DefaultRetryTimeout,
+	}
+}
+
+// newTransport returns a pooled transport based on http.DefaultTransport
+func newTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = DefaultMaxIdleConnsPerHost
+	return transport
+}
+
+// post sends a JSON POST request and returns the response status and body.
+// Connection errors and transient status codes are retried with exponential
+// backoff and jitter; timeouts are not. The first attempt is bounded only by
+// ctx and HTTPClient.Timeout, the retries after it also by RetryTimeout.
+func (c *Client) post(ctx context.Context, url string, reqBody []byte) (int, []byte, error) {
+	attempts := c.MaxRetries
+	if attempts < 1 {
+		attempts = 1
+	}
+
+	var status int
+	var body []byte
+	var err error
+retry:
+	for attempt := 0; attempt < attempts; attempt++ {
+		if attempt > 0 {
+			if attempt == 1 && c.RetryTimeout > 0 {
+				// Retries share one budget, started after the first attempt
+				var cancel context.CancelFunc
+				ctx, cancel = context.WithTimeout(ctx, c.RetryTimeout)
+				defer cancel()
+			}
+
+			delay := c.RetryBaseDelay * time.Duration(1<<(attempt-1))
+			delay = time.Duration(float64(delay) * (1 + rand.Float64()*retryJitter))
+			if delay > retryMaxDelay {
+				delay = retryMaxDelay
+			}
+
+			select {
+			case <-ctx.Done():
+				// Out of retry time: report the last attempt's outcome
+				break retry
+			case <-time.After(delay):
+			}
+		}
+
+		status, body, err = c.send(ctx, url, reqBody)
+		if err != nil {
+			var netErr net.Error
+			if ctx.Err() != nil || (errors.As(err, &netErr) && netErr.Timeout()) {
+				break
+			}
+			continue
+		}
+
+		if !retryableStatus[status] {
+			break
+		}
+	}
+
+	if err != nil {
+		return 0, nil, fmt.Errorf("failed to send request: %w", err)
+	}
+	return status, body, nil
+}
+
+// send performs a single POST attempt and reads the full response body
+func (c *Client) send(ctx context.Context, url string, reqBody []byte) (int, []byte, error) {
+	httpReq, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewReader(reqBody))
+	if err != nil {
+		return 0, nil, err
+	}
+
+	httpReq.Header.Set("Content-Type", "application/json")
+	httpReq.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.APIKey))
+
+	resp, err := c.HTTPClient.Do(httpReq)
+	if err != nil {
+		return 0, nil, err
+	}
+	defer resp.Body.Close()
+
+	body, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return 0, nil, err
 	}
+	return resp.StatusCode, body, nil
 }
 
 // ChatCompletionRequest represents a chat completion request
@@ -66,27 +184,17 @@ func (c *Client) CreateChatCompletion(ctx context.Context, req ChatCompletionReq
 		return nil, fmt.Errorf("failed to marshal request: %w", err)
 	}
 
-	httpReq, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewBuffer(reqBody))
+	status, body, err := c.post(ctx, url, reqBody)
 	if err != nil {
-		return nil, fmt.Errorf("failed to create request: %w", err)
+		return nil, err
 	}
 
-	httpReq.Header.Set("Content-Type", "application/json")
-	httpReq.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.APIKey))
-
-	resp, err := c.HTTPClient.Do(httpReq)
-	if err != nil {
-		return nil, fmt.Errorf("failed to send request: %w", err)
-	}
-	defer resp.Body.Close()
-
-	if resp.StatusCode != http.StatusOK {
-		body, _ := io.ReadAll(resp.Body)
-		return nil, fmt.Errorf("API error: %d - %s", resp.StatusCode, string(body))
+	if status != http.StatusOK {
+		return nil, fmt.Errorf("API error: %d - %s", status, string(body))
 	}
 
 	var chatResp ChatCompletionResponse
-	if err := json.NewDecoder(resp.Body).Decode(&chatResp); err != nil {
+	if err := json.Unmarshal(body, &chatResp); err != nil {
 		return nil, fmt.Errorf("failed to decode response: %w", err)
 	}
 
@@ -114,27 +222,17 @@ func (c *Client) OCR(ctx context.Context, req OCRRequest) (*OCRResponse, error)
 		return nil, fmt.Errorf("failed to marshal request: %w", err)
 	}
 
-	httpReq, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewBuffer(reqBody))
-	if err != nil {
-		return nil, fmt.Errorf("failed to create request: %w", err)
-	}
-
-	httpReq.Header.Set("Content-Type", "application/json")
-	httpReq.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.APIKey))
-
-	resp, err := c.HTTPClient.Do(httpReq)
+	status, body, err := c.post(ctx, url, reqBody)
 	if err != nil {
-		return nil, fmt.Errorf("failed to send request: %w", err)
+		return nil, err
 	}
-	defer resp.Body.Close()
 
-	if resp.StatusCode != http.StatusOK {
-		body, _ := io.ReadAll(resp.Body)
-		return nil, fmt.Errorf("API error: %d - %s", resp.StatusCode, string(body))
+	if status != http.StatusOK {
+		return nil, fmt.Errorf("API error: %d - %s", status, string(body))
 	}
 
 	var ocrResp OCRResponse
-	if err := json.NewDecoder(resp.Body).Decode(&ocrResp); err != nil {
+	if err := json.Unmarshal(body, &ocrResp); err != nil {
 		return nil, fmt.Errorf("failed to decode response: %w", err)
 	}
 
@@ -162,27 +260,17 @@ func (c *Client) OCRForm(ctx context.Context, req OCRFormRequest) (*OCRFormRespo
 		return nil, fmt.Errorf("failed to marshal request: %w", err)
 	}
 
-	httpReq, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewBuffer(reqBody))
+	status, body, err := c.post(ctx, url, reqBody)
 	if err != nil {
-		return nil, fmt.Errorf("failed to create request: %w", err)
+		return nil, err
 	}
 
-	httpReq.Header.Set("Content-Type", "application/json")
-	httpReq.Header.Set("Authorization", fmt.Sprintf("Bearer %s", c.APIKey))
-
-	resp, err := c.HTTPClient.Do(httpReq)
-	if err != nil {
-		return nil, fmt.Errorf("failed to send request: %w", err)
-	}
-	defer resp.Body.Close()
-
-	if resp.StatusCode != http.StatusOK {
-		body, _ := io.ReadAll(resp.Body)
-		return nil, fmt.Errorf("API error: %d - %s", resp.StatusCode, string(body))
+	if status != http.StatusOK {
+		return nil, fmt.Errorf("API error: %d - %s", status, string(body))
 	}
 
 	var ocrFormResp OCRFormResponse
-	if err := json.NewDecoder(resp.Body).Decode(&ocrFormResp); err != nil {
+	if err := json.Unmarshal(body, &ocrFormResp); err != nil {
 		return nil, fmt.Errorf("failed to decode response: %w", err)
 	}
 
@@ -0,0 +1,143 @@
+package kolosal
+
+import (
+	"context"
+	"net/http"
+	"net/http/httptest"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+// TestCreateChatCompletionRetry tests retrying of transient API errors
+func TestCreateChatCompletionRetry(t *testing.T) {
+	tests := []struct {
+		name          string
+		statuses      []int
+		expectedCalls int
+		expectError   bool
+	}{
+		{
+			name:          "Success after transient error",
+			statuses:      []int{http.StatusServiceUnavailable, http.StatusOK},
+			expectedCalls: 2,
+		},
+		{
+			name:          "Client error is not retried",
+			statuses:      []int{http.StatusBadRequest},
+			expectedCalls: 1,
+			expectError:   true,
+		},
+		{
+			name:          "Gives up after max retries",
+			statuses:      []int{http.StatusTooManyRequests, http.StatusTooManyRequests},
+			expectedCalls: 2,
+			expectError:   true,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var calls atomic.Int32
+			server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+				n := int(calls.Add(1)) - 1
+				status := tt.statuses[len(tt.statuses)-1]
+				if n < len(tt.statuses) {
+					status = tt.statuses[n]
+				}
+
+				w.WriteHeader(status)
+				if status == http.StatusOK {
+					w.Write([]byte(`{"choices":[{"message":{"role":"assistant","content":"ok"}}]}`))
+				}
+			}))
+			defer server.Close()
+
+			client := NewClient("test-key")
+			client.BaseURL = server.URL
+			client.MaxRetries = 2
+			client.RetryBaseDelay = time.Millisecond
+
+			resp, err := client.CreateChatCompletion(context.Background(), ChatCompletionRequest{Model: "default"})
+
+			if got := int(calls.Load()); got != tt.expectedCalls {
+				t.Errorf("Expected %d calls, got %d", tt.expectedCalls, got)
+			}
+
+			if tt.expectError {
+				if err == nil {
+					t.Error("Expected error")
+				}
+				return
+			}
+
+			if err != nil {
+				t.Fatalf("Unexpected error: %v", err)
+			}
+			if len(resp.Choices) != 1 || resp.Choices[0].Message.Content != "ok" {
+				t.Errorf("Unexpected response: %+v", resp)
+			}
+		})
+	}
+}
+
+// TestCreateChatCompletionRetryBudget tests that retries stay within the call's time budget
+func TestCreateChatCompletionRetryBudget(t *testing.T) {
+	t.Run("Client timeout is not retried", func(t *testing.T) {
+		var calls atomic.Int32
+		server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			calls.Add(1)
+			time.Sleep(200 * time.Millisecond)
+		}))
+		defer server.Close()
+
+		client := NewClient("test-key")
+		client.BaseURL = server.URL
+		client.HTTPClient.Timeout = 50 * time.Millisecond
+		client.RetryBaseDelay = time.Millisecond
+
+		if _, err := client.CreateChatCompletion(context.Background(), ChatCompletionRequest{Model: "default"}); err == nil {
+			t.Error("Expected error")
+		}
+		if got := calls.Load(); got != 1 {
+			t.Errorf("Expected 1 call, got %d", got)
+		}
+	})
+
+	t.Run("First attempt is not bound by retry timeout", func(t *testing.T) {
+		server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			time.Sleep(100 * time.Millisecond)
+			w.Write([]byte(`{"choices":[{"message":{"role":"assistant","content":"ok"}}]}`))
+		}))
+		defer server.Close()
+
+		client := NewClient("test-key")
+		client.BaseURL = server.URL
+		client.RetryTimeout = 10 * time.Millisecond
+
+		if _, err := client.CreateChatCompletion(context.Background(), ChatCompletionRequest{Model: "default"}); err != nil {
+			t.Errorf("Unexpected error: %v", err)
+		}
+	})
+
+	t.Run("Retries stop at retry timeout", func(t *testing.T) {
+		server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			w.WriteHeader(http.StatusServiceUnavailable)
+		}))
+		defer server.Close()
+
+		client := NewClient("test-key")
+		client.BaseURL = server.URL
+		client.MaxRetries = 10
+		client.RetryBaseDelay = 100 * time.Millisecond
+		client.RetryTimeout = 250 * time.Millisecond
+
+		start := time.Now()
+		if _, err := client.CreateChatCompletion(context.Background(), ChatCompletionRequest{Model: "default"}); err == nil {
+			t.Error("Expected error")
+		}
+		if elapsed := time.Since(start); elapsed > time.Second {
+			t.Errorf("Expected call to stop near the 250ms retry timeout, took %v", elapsed)
+		}
+	})
+}